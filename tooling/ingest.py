@@ -8,28 +8,50 @@ Never reads file contents except for computing checksums.
 
 import argparse
 import csv
+import errno
+import functools
 import hashlib
+import itertools
+import json
 import os
 import re
 import shutil
+import string
 import sys
+import tempfile
 import time
 import unicodedata
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-try:
-    import yaml
-except ImportError:
-    print("Error: pyyaml not installed. Run: pip install pyyaml", file=sys.stderr)
-    sys.exit(1)
 
-try:
-    import pandas as pd
-except ImportError:
-    print("Error: pandas not installed. Run: pip install pandas", file=sys.stderr)
-    sys.exit(1)
+# Files inside the tooling repo are never ingested
+TOOLING_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# Number of files hashed concurrently by batch commands
+HASH_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Number of files waiting on stabilization concurrently (mostly sleeping)
+STABILIZE_WORKERS = 16
+
+# Batch commands flush manifest rows to disk every this many rows
+MANIFEST_FLUSH_ROWS = 32
+
+# Manifests at least this large get a Parquet mirror for faster reads
+# (below this, scanning the CSV beats importing pyarrow)
+MANIFEST_PARQUET_MIN_BYTES = 16 << 20
+
+# Bytes per digest in the manifest's digest index (SHA256 and BLAKE3)
+HASH_INDEX_RECORD_SIZE = 32
+
+# Reads kept in flight by the io_uring SHA256 backend
+URING_QUEUE_DEPTH = 8
+
+# Digest algorithms accepted for hashing.algorithm in config.yaml
+HASH_ALGORITHMS = ('sha256', 'blake3')
 
 
 # ============================================================================
@@ -37,13 +59,37 @@ except ImportError:
 # ============================================================================
 
 def load_config(config_path: str = "tooling/config.yaml") -> Dict:
-    """Load and validate configuration from YAML file."""
+    """
+    Load and validate configuration from YAML file.
+
+    The validated config is cached as JSON next to the YAML file and reused
+    while the cache is at least as new as the YAML.
+    """
     if not os.path.exists(config_path):
         print(f"Error: Config file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
 
+    cache_path = f"{config_path}.cache.json"
+
+    # Use cached config if it is up to date
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(config_path).st_mtime:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    # Imported lazily: not needed when the cache is fresh
+    try:
+        import yaml
+    except ImportError:
+        print("Error: pyyaml not installed. Run: pip install pyyaml", file=sys.stderr)
+        sys.exit(1)
+
+    # Prefer the libyaml-backed loader when available; same semantics
+    Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=Loader)
 
     # Validate required fields
     if 'projects_base' not in config:
@@ -54,58 +100,363 @@ def load_config(config_path: str = "tooling/config.yaml") -> Dict:
         print("Error: Please edit config.yaml and replace REPLACE_ME with your actual paths", file=sys.stderr)
         sys.exit(1)
 
+    algorithm = get_hash_algorithm(config)
+    if algorithm not in HASH_ALGORITHMS:
+        print(f"Error: Unsupported hashing.algorithm '{algorithm}' in config.yaml "
+              f"(choose from: {', '.join(HASH_ALGORITHMS)})", file=sys.stderr)
+        sys.exit(1)
+
     # Expand user paths
     config['projects_base'] = os.path.expanduser(config['projects_base'])
     if 'downloads_dir' in config:
         config['downloads_dir'] = os.path.expanduser(config['downloads_dir'])
 
+    write_config_cache(cache_path, config, config_path)
+
     return config
 
 
+def get_hash_algorithm(config: Dict) -> str:
+    """Return the configured digest algorithm (default: sha256)."""
+    return (config.get('hashing') or {}).get('algorithm', 'sha256')
+
+
+def write_config_cache(cache_path: str, config: Dict, config_path: str) -> None:
+    """
+    Atomically write the validated config to its JSON cache.
+
+    The cache gets the YAML's permissions so every user who can read the
+    config can use it.
+    """
+    cache_dir = os.path.dirname(cache_path) or '.'
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(config, f)
+            shutil.copymode(config_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Caching is best-effort; the YAML remains the source of truth
+        pass
+
+
 # ============================================================================
 # File Operations
 # ============================================================================
 
 def stabilize_file(filepath: str, poll_interval: float = 0.5,
-                   stable_count: int = 3, timeout: float = 30) -> bool:
+                   stable_count: int = 3, timeout: float = 30,
+                   settle_time: float = 2.0) -> bool:
     """
     Wait for file size to stabilize (useful for in-progress downloads).
 
+    Files not modified within the last `settle_time` seconds are treated as
+    stable immediately. Otherwise polls (every 0.1s for the first second,
+    then every `poll_interval`) until the size is unchanged for
+    `stable_count` intervals or the file settles.
+
     Returns True if stable, False if timeout reached.
     """
     if not os.path.exists(filepath):
         return False
 
     start_time = time.time()
+    stable_window = stable_count * poll_interval
     last_size = -1
-    stable_checks = 0
+    stable_since = start_time
 
     while time.time() - start_time < timeout:
-        current_size = os.path.getsize(filepath)
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            return False
+        now = time.time()
 
-        if current_size == last_size:
-            stable_checks += 1
-            if stable_checks >= stable_count:
+        if now - st.st_mtime >= settle_time:
+            return True
+
+        if st.st_size == last_size:
+            if now - stable_since >= stable_window:
                 return True
         else:
-            stable_checks = 0
-            last_size = current_size
+            last_size = st.st_size
+            stable_since = now
 
-        time.sleep(poll_interval)
+        time.sleep(0.1 if now - start_time < 1.0 else poll_interval)
 
     # Timeout reached, but file exists - probably okay
     return True
 
 
-def compute_sha256(filepath: str, chunk_size: int = 8192) -> str:
-    """Compute SHA256 hash of file contents."""
-    sha256_hash = hashlib.sha256()
+def compute_digest(filepath: str, algorithm: str = 'sha256') -> str:
+    """Compute the hex digest of file contents with the given algorithm."""
+    if algorithm == 'blake3':
+        return compute_blake3(filepath)
+    return compute_sha256(filepath)
+
+
+def check_hash_backend(algorithm: str) -> None:
+    """Exit with an install hint if the package for `algorithm` is missing."""
+    if algorithm != 'blake3':
+        return
+
+    try:
+        import blake3  # noqa: F401
+    except ImportError:
+        print("Error: blake3 not installed. Run: pip install blake3", file=sys.stderr)
+        sys.exit(1)
+
+
+def compute_blake3(filepath: str) -> str:
+    """
+    Compute BLAKE3 hash of file contents (memory-mapped, multithreaded).
+
+    Callers check check_hash_backend() first; this may run in worker threads.
+    """
+    from blake3 import blake3
+
+    blake3_hash = blake3(max_threads=blake3.AUTO)
+    blake3_hash.update_mmap(filepath)
+    return blake3_hash.hexdigest()
+
+
+def compute_sha256(filepath: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute SHA256 hash of file contents.
+
+    Where supported, hints the kernel that the file is read sequentially.
+    Its pages stay cached for move_file, which copies across filesystems.
+    """
+    with open(filepath, "rb", buffering=chunk_size) as f:
+        fd = f.fileno()
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        # Linux with liburing: overlap disk reads with hashing
+        digest = sha256_uring(fd, chunk_size)
+        if digest is not None:
+            return digest
+
+        # Python 3.11+: C-level read/update loop that releases the GIL
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        sha256_hash = hashlib.sha256()
+        buf = memoryview(bytearray(chunk_size))
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            sha256_hash.update(buf[:n])
+
+        return sha256_hash.hexdigest()
+
+
+def drop_page_cache(filepath: str) -> None:
+    """Hint the kernel to drop a file's cached pages (best-effort)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=None)
+def load_liburing():
+    """
+    Return the liburing module if io_uring is usable here, else None.
+
+    Checked once per process: requires Linux, the optional liburing package,
+    and a kernel (and seccomp policy) that allows creating a ring and
+    supports IORING_OP_READ (5.6+; older kernels also lack the probe).
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        import liburing
+    except ImportError:
+        return None
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(1, ring)
+    except OSError:
+        return None
+    liburing.io_uring_queue_exit(ring)
+
+    try:
+        probe = liburing.io_uring_get_probe()
+    except OSError:
+        return None
+    if probe is None:
+        return None
+    try:
+        if not liburing.io_uring_opcode_supported(probe, liburing.io_uring_op.IORING_OP_READ):
+            return None
+    finally:
+        liburing.io_uring_free_probe(probe)
+
+    return liburing
+
+
+def sha256_uring(fd: int, chunk_size: int = 1 << 20,
+                 depth: int = URING_QUEUE_DEPTH) -> Optional[str]:
+    """
+    Compute SHA256 of an open file, keeping `depth` io_uring reads in flight.
+
+    Chunks are hashed in file order as their reads complete. Returns None if
+    io_uring is unavailable (or the kernel rejects its reads) so the caller
+    can fall back to plain reads.
+    """
+    liburing = load_liburing()
+    if liburing is None:
+        return None
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(depth, ring)
+    except OSError:
+        return None
+
+    cqe = liburing.Cqe()
+    in_flight = 0
+    try:
+        size = os.fstat(fd).st_size
+        num_chunks = (size + chunk_size - 1) // chunk_size
+        bufs = [bytearray(chunk_size) for _ in range(depth)]
+        completed = {}
+        sha256_hash = hashlib.sha256()
+        next_submit = 0
+        next_hash = 0
+
+        while next_hash < num_chunks:
+            # Refill the queue; a buffer is reused once its chunk is hashed
+            while next_submit < num_chunks and next_submit - next_hash < depth:
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, fd, bufs[next_submit % depth],
+                                            next_submit * chunk_size)
+                liburing.io_uring_sqe_set_data64(sqe, next_submit)
+                next_submit += 1
+            in_flight += liburing.io_uring_submit(ring)
+
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = liburing.io_uring_cqe_get_data64(entry)
+            result = entry.res
+            liburing.io_uring_cqe_seen(ring, entry)
+            in_flight -= 1
+            if result in (-errno.EINVAL, -errno.EOPNOTSUPP):
+                # Read opcode rejected: fall back to plain reads, which can
+                # start from offset 0 since only pread-style reads were issued
+                return None
+            completed[index] = liburing.trap_error(result)
+
+            while next_hash in completed:
+                n = completed.pop(next_hash)
+                offset = next_hash * chunk_size
+                sha256_hash.update(memoryview(bufs[next_hash % depth])[:n])
+
+                # Finish short reads synchronously
+                wanted = min(chunk_size, size - offset)
+                remaining = wanted - n
+                while remaining > 0:
+                    data = os.pread(fd, remaining, offset + wanted - remaining)
+                    if not data:
+                        break
+                    sha256_hash.update(data)
+                    remaining -= len(data)
+
+                next_hash += 1
+
+        # Anything appended after fstat, to match a read-to-EOF loop
+        offset = size
+        while True:
+            data = os.pread(fd, chunk_size, offset)
+            if not data:
+                break
+            sha256_hash.update(data)
+            offset += len(data)
+
+        return sha256_hash.hexdigest()
+    finally:
+        # After an error, reads may still be in flight into bufs; reap them
+        # before the ring is torn down and the buffers can be freed
+        while in_flight > 0:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            liburing.io_uring_cqe_seen(ring, cqe[0])
+            in_flight -= 1
+        liburing.io_uring_queue_exit(ring)
+
+
+def hash_file(filepath: str, algorithm: str = 'sha256') -> Optional[Tuple[str, int, bool]]:
+    """
+    Stabilize and hash a file without touching the manifest.
+
+    Safe to run from worker threads. Returns (digest, size_bytes, stable),
+    or None if the file does not exist.
+    """
+    return hash_stabilized_file(filepath, algorithm, stabilize_file(filepath))
+
+
+def hash_stabilized_file(filepath: str, algorithm: str,
+                         stable: bool) -> Optional[Tuple[str, int, bool]]:
+    """Hash stage of hash_file(), for a file stabilize_file() already checked."""
+    try:
+        digest = compute_digest(filepath, algorithm)
+        size_bytes = os.stat(filepath).st_size
+    except FileNotFoundError:
+        return None
+
+    return digest, size_bytes, stable
+
+
+def submit_hash_pipeline(filepath: str, algorithm: str,
+                         stabilize_pool: ThreadPoolExecutor,
+                         hash_pool: ThreadPoolExecutor) -> Future:
+    """
+    Run hash_file() as two pipelined stages: stabilize, then hash.
+
+    Files still being written wait in `stabilize_pool` without holding a
+    hash worker. Returns a future for the hash_file() result. Shut down
+    `stabilize_pool` before `hash_pool` so pending hand-offs complete.
+    """
+    result = Future()
+
+    def copy_result(future: Future) -> None:
+        try:
+            result.set_result(future.result())
+        except BaseException as e:
+            result.set_exception(e)
+
+    def on_stabilized(future: Future) -> None:
+        try:
+            stable = future.result()
+            hash_pool.submit(hash_stabilized_file, filepath, algorithm, stable) \
+                .add_done_callback(copy_result)
+        except BaseException as e:
+            result.set_exception(e)
+
+    stabilize_pool.submit(stabilize_file, filepath).add_done_callback(on_stabilized)
+    return result
 
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            sha256_hash.update(chunk)
 
-    return sha256_hash.hexdigest()
+# Patterns used by slugify
+_WS_RE = re.compile(r'\s+')
+_UNSAFE_RE = re.compile(r'[^A-Za-z0-9._-]')
+_DASH_RE = re.compile(r'-+')
 
 
 def slugify(text: str, max_len: int = 60) -> str:
@@ -118,18 +469,19 @@ def slugify(text: str, max_len: int = 60) -> str:
     - Collapse multiple hyphens
     - Limit length
     """
-    # Normalize unicode to ASCII
-    text = unicodedata.normalize('NFKD', text)
-    text = text.encode('ascii', 'ignore').decode('ascii')
+    # Normalize unicode to ASCII (most filenames already are)
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)
+        text = text.encode('ascii', 'ignore').decode('ascii')
 
     # Replace whitespace with hyphens
-    text = re.sub(r'\s+', '-', text)
+    text = _WS_RE.sub('-', text)
 
     # Keep only safe characters
-    text = re.sub(r'[^A-Za-z0-9._-]', '', text)
+    text = _UNSAFE_RE.sub('', text)
 
     # Collapse multiple hyphens
-    text = re.sub(r'-+', '-', text)
+    text = _DASH_RE.sub('-', text)
 
     # Strip leading/trailing hyphens
     text = text.strip('-')
@@ -141,9 +493,12 @@ def slugify(text: str, max_len: int = 60) -> str:
     return text
 
 
-def generate_timestamped_filename(original_name: str, config: Dict) -> str:
+def generate_timestamped_filename(original_name: str, config: Dict,
+                                  now: Optional[datetime] = None) -> str:
     """
     Generate timestamped filename: slug_YYYY-MM-DDTHHMMSS.ext
+
+    `now` defaults to the current time.
     """
     # Get naming config
     naming = config.get('naming', {})
@@ -158,7 +513,7 @@ def generate_timestamped_filename(original_name: str, config: Dict) -> str:
         ext = ext.lower()
 
     # Generate timestamp
-    timestamp = datetime.now().strftime(timestamp_format)
+    timestamp = (now or datetime.now()).strftime(timestamp_format)
 
     # Generate slug from base
     slug = slugify(base, max_len=slug_maxlen)
@@ -175,97 +530,497 @@ def generate_timestamped_filename(original_name: str, config: Dict) -> str:
 def handle_collision(target_path: str) -> str:
     """
     If target path exists, append -a, -b, etc. before extension.
-    """
-    if not os.path.exists(target_path):
-        return target_path
 
+    The returned path is reserved by atomically creating an empty placeholder
+    (O_CREAT | O_EXCL), so the caller should move the file over it.
+    """
     base, ext = os.path.splitext(target_path)
-    suffix = ord('a')
-
-    while True:
-        new_path = f"{base}-{chr(suffix)}{ext}"
-        if not os.path.exists(new_path):
-            return new_path
-        suffix += 1
-        if suffix > ord('z'):
-            # Fallback to numbers
-            counter = 1
-            while True:
-                new_path = f"{base}-{counter}{ext}"
-                if not os.path.exists(new_path):
-                    return new_path
-                counter += 1
+    suffixes = itertools.chain(
+        [''],
+        (f"-{c}" for c in string.ascii_lowercase),
+        # Fallback to numbers
+        (f"-{i}" for i in itertools.count(1)),
+    )
+
+    for suffix in suffixes:
+        candidate = f"{base}{suffix}{ext}"
+        try:
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return candidate
+
+
+def move_file(src: str, dest: str) -> None:
+    """Move a file onto a reserved destination, atomically when possible."""
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            os.remove(dest)
+            raise
+        # Different filesystem: fall back to copy + delete
+        try:
+            shutil.move(src, dest)
+        except OSError:
+            os.remove(dest)
+            raise
+
+    # Hashed and moved (or copied); ingest does not read it again
+    drop_page_cache(dest)
 
 
 # ============================================================================
 # Manifest Management
 # ============================================================================
 
+# Manifest columns, in file order
+MANIFEST_FIELDS = (
+    'project', 'stage', 'path', 'ts', 'original_name',
+    'size_bytes', 'sha256', 'source', 'notes', 'action',
+    'derived_from', 'code_commit', 'digest_algo'
+)
+
+
 def ensure_manifest(manifest_path: str) -> None:
-    """Create manifest CSV with header if it doesn't exist."""
+    """
+    Create manifest CSV with header if it doesn't exist.
+
+    Manifests written before the digest_algo column existed are upgraded in
+    place; their digests are all SHA256.
+    """
     if os.path.exists(manifest_path):
+        # Only the (ASCII) header matters here; later rows may not be UTF-8
+        with open(manifest_path, newline='', errors='replace') as f:
+            existing = next(csv.reader(f), [])
+        if existing and 'digest_algo' not in existing:
+            upgrade_manifest(manifest_path)
         return
 
     # Create parent directory if needed
     os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
 
     # Create with header
-    header = [
-        'project', 'stage', 'path', 'ts', 'original_name',
-        'size_bytes', 'sha256', 'source', 'notes', 'action',
-        'derived_from', 'code_commit'
-    ]
-
     with open(manifest_path, 'w', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow(header)
+        writer.writerow(MANIFEST_FIELDS)
 
 
-def check_duplicate(manifest_path: str, sha256: str) -> Optional[str]:
+def upgrade_manifest(manifest_path: str) -> None:
     """
-    Check if SHA256 already exists in manifest.
+    Atomically add the digest_algo column to an existing manifest.
+
+    Bytes that are not valid UTF-8 are passed through unchanged.
+    """
+    with open(manifest_path, newline='', errors='surrogateescape') as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames) + ['digest_algo']
+        rows = list(reader)
+
+    for row in rows:
+        row['digest_algo'] = 'sha256' if row.get('sha256') else ''
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='', errors='surrogateescape') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(rows)
+        shutil.copymode(manifest_path, tmp_path)
+        os.replace(tmp_path, manifest_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_manifest_path(project: str, config: Dict) -> str:
+    """Return the manifest CSV path for a project."""
+    return os.path.join(config['projects_base'], project, 'catalog', 'manifest.csv')
+
+
+def check_duplicate(manifest_path: str, digest: str,
+                    algorithm: str = 'sha256') -> Optional[str]:
+    """
+    Check if a digest computed with `algorithm` already exists in manifest.
     Returns the path of the existing file if found, None otherwise.
     """
     if not os.path.exists(manifest_path):
         return None
 
-    try:
-        df = pd.read_csv(manifest_path)
-        if 'sha256' not in df.columns:
-            return None
+    mirror = read_manifest_parquet(manifest_path, ['sha256', 'path', 'digest_algo'])
+    if mirror is not None:
+        for row_algo, row_digest, row_path in iter_mirror_hashes(mirror):
+            if row_digest == digest and row_algo == algorithm:
+                return row_path
+        return None
 
-        matches = df[df['sha256'] == sha256]
-        if len(matches) > 0:
-            return matches.iloc[0]['path']
-    except Exception as e:
+    try:
+        with open(manifest_path, newline='') as f:
+            reader = csv.DictReader(f)
+            if 'sha256' not in (reader.fieldnames or []):
+                return None
+
+            for row in reader:
+                if (row['sha256'] == digest
+                        and (row.get('digest_algo') or 'sha256') == algorithm):
+                    return row['path']
+    except (OSError, csv.Error, ValueError) as e:
         print(f"Warning: Error reading manifest: {e}", file=sys.stderr)
         return None
 
     return None
 
 
+def load_known_hashes(manifest_path: str) -> Dict[Tuple[str, str], str]:
+    """
+    Load a (digest_algo, digest) -> path map of every entry in the manifest.
+
+    Used by batch commands to check duplicates without rescanning the
+    manifest per file. The first entry for a hash wins, as in check_duplicate.
+    """
+    known = {}
+    if not os.path.exists(manifest_path):
+        return known
+
+    mirror = read_manifest_parquet(manifest_path, ['sha256', 'path', 'digest_algo'])
+    if mirror is not None:
+        for row_algo, row_digest, row_path in iter_mirror_hashes(mirror):
+            known.setdefault((row_algo, row_digest), row_path)
+        return known
+
+    try:
+        with open(manifest_path, newline='') as f:
+            reader = csv.DictReader(f)
+            if 'sha256' not in (reader.fieldnames or []):
+                return known
+
+            for row in reader:
+                algorithm = row.get('digest_algo') or 'sha256'
+                known.setdefault((algorithm, row['sha256']), row['path'])
+    except (OSError, csv.Error, ValueError) as e:
+        print(f"Warning: Error reading manifest: {e}", file=sys.stderr)
+
+    return known
+
+
+def get_hash_index_path(manifest_path: str) -> str:
+    """Return the digest index path for a manifest CSV."""
+    return os.path.splitext(manifest_path)[0] + '.sha256.idx'
+
+
+def hash_index_is_fresh(manifest_path: str) -> bool:
+    """True if the digest index exists and is at least as new as the CSV."""
+    try:
+        index_mtime = os.stat(get_hash_index_path(manifest_path)).st_mtime_ns
+        return index_mtime >= os.stat(manifest_path).st_mtime_ns
+    except OSError:
+        return False
+
+
+def rebuild_hash_index(manifest_path: str) -> None:
+    """Atomically rewrite the digest index from every digest in the CSV."""
+    digests = bytearray()
+    with open(manifest_path, newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                raw = bytes.fromhex(row.get('sha256') or '')
+            except ValueError:
+                continue
+            if len(raw) == HASH_INDEX_RECORD_SIZE:
+                digests += raw
+
+    index_path = get_hash_index_path(manifest_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(digests)
+        shutil.copymode(manifest_path, tmp_path)
+        os.replace(tmp_path, index_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def ensure_hash_index(manifest_path: str) -> bool:
+    """
+    Rebuild the digest index if it is missing or older than the CSV.
+
+    Best-effort: on failure the index is discarded (see discard_hash_index)
+    and False is returned; the CSV is never affected.
+    """
+    if not os.path.exists(manifest_path) or hash_index_is_fresh(manifest_path):
+        return True
+
+    try:
+        rebuild_hash_index(manifest_path)
+    except (OSError, csv.Error, ValueError) as e:
+        discard_hash_index(manifest_path, e)
+        return False
+    return True
+
+
+def discard_hash_index(manifest_path: str, error: Exception) -> None:
+    """Warn about a digest index failure and remove the index so it is rebuilt."""
+    print(f"Warning: Could not update manifest digest index: {error}", file=sys.stderr)
+    try:
+        os.unlink(get_hash_index_path(manifest_path))
+    except OSError:
+        pass
+
+
+def load_hash_index(manifest_path: str) -> Optional[Set[bytes]]:
+    """
+    Load the set of raw digests recorded in the manifest.
+
+    The index (catalog/manifest.sha256.idx) holds one fixed-size raw digest
+    per manifest row, so it loads with a single read and no CSV parsing. It
+    is rebuilt from the CSV when stale, e.g. after the R helpers write to the
+    manifest. Used by batch commands to put off loading the full manifest
+    until a file may be a duplicate. Returns None if the index cannot be used.
+    """
+    if not os.path.exists(manifest_path):
+        return set()
+
+    if not ensure_hash_index(manifest_path):
+        return None
+
+    try:
+        with open(get_hash_index_path(manifest_path), 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        print(f"Warning: Error reading manifest digest index: {e}", file=sys.stderr)
+        return None
+
+    size = HASH_INDEX_RECORD_SIZE
+    return {data[i:i + size] for i in range(0, len(data) - size + 1, size)}
+
+
+def append_hash_index(manifest_path: str, digests: List[bytes]) -> None:
+    """
+    Append raw digests to the manifest's digest index (best-effort).
+
+    A missing index is left missing rather than recreated with only these
+    digests; the next load rebuilds it from the CSV.
+    """
+    try:
+        fd = os.open(get_hash_index_path(manifest_path), os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        discard_hash_index(manifest_path, e)
+        return
+
+    try:
+        with os.fdopen(fd, 'ab') as f:
+            f.write(b''.join(digests))
+    except OSError as e:
+        discard_hash_index(manifest_path, e)
+
+
+def row_digest(row: Dict) -> Optional[bytes]:
+    """Return a manifest row's digest as index bytes, or None if it has none."""
+    try:
+        raw = bytes.fromhex(row.get('sha256') or '')
+    except ValueError:
+        return None
+    return raw if len(raw) == HASH_INDEX_RECORD_SIZE else None
+
+
+@functools.lru_cache(maxsize=None)
+def load_pyarrow():
+    """Return (pyarrow, pyarrow.csv, pyarrow.parquet) if installed, else None."""
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.parquet
+    except ImportError:
+        return None
+
+    return pyarrow, pyarrow.csv, pyarrow.parquet
+
+
+def get_parquet_path(manifest_path: str) -> str:
+    """Return the Parquet mirror path for a manifest CSV."""
+    return os.path.splitext(manifest_path)[0] + '.parquet'
+
+
+def read_manifest_parquet(manifest_path: str, columns: List[str]) -> Optional[Any]:
+    """
+    Read columns from the manifest's Parquet mirror as a pyarrow Table.
+
+    Columns missing from the mirror are left out. Returns None if the mirror
+    is missing, older than the CSV, or unreadable so the caller can fall
+    back to the CSV.
+    """
+    parquet_path = get_parquet_path(manifest_path)
+    try:
+        if os.stat(parquet_path).st_mtime < os.stat(manifest_path).st_mtime:
+            return None
+    except OSError:
+        return None
+
+    modules = load_pyarrow()
+    if modules is None:
+        return None
+    _, _, pq = modules
+
+    try:
+        parquet_file = pq.ParquetFile(parquet_path)
+        available = set(parquet_file.schema_arrow.names)
+        return parquet_file.read(columns=[c for c in columns if c in available])
+    except (OSError, ValueError):
+        return None
+
+
+def iter_mirror_hashes(table: Any):
+    """Yield (digest_algo, digest, path) for each row of a Parquet mirror table."""
+    names = table.column_names
+    if 'sha256' not in names or 'path' not in names:
+        return
+
+    digests = table.column('sha256').to_pylist()
+    paths = table.column('path').to_pylist()
+    if 'digest_algo' in names:
+        algos = table.column('digest_algo').to_pylist()
+    else:
+        algos = [''] * len(digests)
+
+    for algorithm, digest, path in zip(algos, digests, paths):
+        yield algorithm or 'sha256', digest, path
+
+
+def sync_manifest_parquet(manifest_path: str) -> None:
+    """
+    Rebuild the Parquet mirror of a manifest once it is large enough.
+
+    The CSV remains the append-only source of truth; the mirror is only
+    used for reads while it is at least as new as the CSV. Best-effort:
+    skipped when pyarrow is not installed.
+    """
+    try:
+        if os.path.getsize(manifest_path) < MANIFEST_PARQUET_MIN_BYTES:
+            return
+    except OSError:
+        return
+
+    modules = load_pyarrow()
+    if modules is None:
+        return
+    pa, pa_csv, pq = modules
+
+    parquet_path = get_parquet_path(manifest_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix='.tmp')
+    os.close(fd)
+    try:
+        os.chmod(tmp_path, 0o644)
+        # Keep every column as text, matching how the CSV is read elsewhere
+        table = pa_csv.read_csv(
+            manifest_path,
+            # Notes may span lines (quoted by csv.writer)
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={field: pa.string() for field in MANIFEST_FIELDS}
+            ),
+        )
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ValueError) as e:
+        os.unlink(tmp_path)
+        print(f"Warning: Could not update Parquet manifest mirror: {e}", file=sys.stderr)
+
+
 def append_to_manifest(manifest_path: str, row: Dict) -> None:
-    """Append a row to the manifest CSV."""
+    """Append a row to the manifest CSV and its digest index."""
     ensure_manifest(manifest_path)
+    ensure_hash_index(manifest_path)
 
-    # Ensure all required fields are present
-    fields = [
-        'project', 'stage', 'path', 'ts', 'original_name',
-        'size_bytes', 'sha256', 'source', 'notes', 'action',
-        'derived_from', 'code_commit'
-    ]
+    with open(manifest_path, 'a', newline='') as f:
+        write_manifest_row(csv.writer(f), row)
 
-    row_data = [row.get(field, '') for field in fields]
+    # Index is written after the CSV so it stays at least as new
+    digest = row_digest(row)
+    append_hash_index(manifest_path, [digest] if digest else [])
 
-    with open(manifest_path, 'a', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(row_data)
+
+def write_manifest_row(writer: Any, row: Dict) -> None:
+    """Write a row through a csv writer, filling missing fields with ''."""
+    writer.writerow([row.get(field, '') for field in MANIFEST_FIELDS])
+
+
+def open_manifest(manifest_path: str) -> Dict:
+    """
+    Open a manifest for appending.
+
+    Returns a dict with the open 'file', its csv 'writer', the number of
+    'pending' rows not yet flushed, and the 'digests' to add to the digest
+    index on the next flush.
+    """
+    ensure_manifest(manifest_path)
+    ensure_hash_index(manifest_path)
+    f = open(manifest_path, 'a', newline='')
+    return {'file': f, 'writer': csv.writer(f), 'pending': 0, 'digests': []}
+
+
+def flush_manifest(manifest_path: str, manifest: Dict) -> None:
+    """Flush an open manifest's rows to disk, then its digest index."""
+    manifest['file'].flush()
+    # Index is written after the CSV so it stays at least as new
+    append_hash_index(manifest_path, manifest['digests'])
+    manifest['pending'] = 0
+    manifest['digests'] = []
+
+
+def record_manifest_row(manifest_path: str, row: Dict,
+                        manifest_writers: Optional[Dict[str, Dict]] = None) -> None:
+    """
+    Record a manifest row, either with a one-off append or an open writer.
+
+    `manifest_writers` maps manifest paths to open_manifest() results and is
+    filled on first use and flushed every MANIFEST_FLUSH_ROWS rows; callers
+    must close_manifests() when done.
+    """
+    if manifest_writers is None:
+        append_to_manifest(manifest_path, row)
+        return
+
+    if manifest_path not in manifest_writers:
+        manifest_writers[manifest_path] = open_manifest(manifest_path)
+
+    manifest = manifest_writers[manifest_path]
+    write_manifest_row(manifest['writer'], row)
+    digest = row_digest(row)
+    if digest:
+        manifest['digests'].append(digest)
+
+    manifest['pending'] += 1
+    if manifest['pending'] >= MANIFEST_FLUSH_ROWS:
+        flush_manifest(manifest_path, manifest)
+
+
+def close_manifests(manifest_writers: Dict[str, Dict]) -> None:
+    """Close all manifests opened by record_manifest_row and sync their side files."""
+    for manifest_path, manifest in manifest_writers.items():
+        flush_manifest(manifest_path, manifest)
+        manifest['file'].close()
+        sync_manifest_parquet(manifest_path)
+    manifest_writers.clear()
 
 
 # ============================================================================
 # Project Management
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def load_rproj_template() -> Optional[bytes]:
+    """Return the .Rproj template contents (read once), or None if missing."""
+    try:
+        return (Path(__file__).parent / 'templates' / 'project' / '_project.Rproj').read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 def init_project(project_name: str, config: Dict) -> None:
     """
     Initialize a new research project from template.
@@ -296,14 +1051,11 @@ def init_project(project_name: str, config: Dict) -> None:
         os.makedirs(path, exist_ok=True)
         print(f"  ✓ Created {d or '(root)'}/")
 
-    # Copy template files
-    template_dir = Path(__file__).parent / 'templates' / 'project'
-
     # Copy .Rproj file
-    rproj_template = template_dir / '_project.Rproj'
+    rproj_bytes = load_rproj_template()
     rproj_dest = os.path.join(project_path, f"{project_name}.Rproj")
-    if rproj_template.exists():
-        shutil.copy(rproj_template, rproj_dest)
+    if rproj_bytes is not None:
+        Path(rproj_dest).write_bytes(rproj_bytes)
         print(f"  ✓ Created {project_name}.Rproj")
 
     # Create .gitkeep files
@@ -316,31 +1068,37 @@ def init_project(project_name: str, config: Dict) -> None:
 
     for loc in gitkeep_locations:
         gitkeep_path = os.path.join(project_path, loc)
-        with open(gitkeep_path, 'w') as f:
-            f.write("# Placeholder to preserve directory structure\n")
+        Path(gitkeep_path).write_bytes(b"# Placeholder to preserve directory structure\n")
 
     # Create placeholder R files (will be implemented in Step 3)
     r_helpers = os.path.join(project_path, 'R', 'data_helpers.R')
-    with open(r_helpers, 'w') as f:
-        f.write("# Data helper functions\n")
-        f.write("# To be implemented: load_raw_latest(), save_clean(), validate_clean()\n")
+    Path(r_helpers).write_text(
+        "# Data helper functions\n"
+        "# To be implemented: load_raw_latest(), save_clean(), validate_clean()\n"
+    )
     print(f"  ✓ Created R/data_helpers.R (placeholder)")
 
     # Create README
     readme_path = os.path.join(project_path, 'README.md')
-    with open(readme_path, 'w') as f:
-        f.write(f"# {project_name}\n\n")
-        f.write("Research project initialized with the data pipeline.\n\n")
-        f.write("## Setup\n\n")
-        f.write("1. Open `{}.Rproj` in RStudio\n".format(project_name))
-        f.write("2. Run `renv::init()` to set up reproducible environment\n")
-        f.write("3. Install required packages: `install.packages(c('here', 'readr', 'fs', 'pointblank'))`\n")
-        f.write("4. Run `renv::snapshot()` to save package versions\n\n")
-        f.write("## Directory Structure\n\n")
-        f.write("- `data/raw/`: Raw data files (auto-populated by ingest pipeline)\n")
-        f.write("- `data/clean/`: Cleaned data files\n")
-        f.write("- `catalog/manifest.csv`: Data provenance tracking\n")
-        f.write("- `R/`: Analysis scripts and helper functions\n")
+    Path(readme_path).write_text(f"""\
+# {project_name}
+
+Research project initialized with the data pipeline.
+
+## Setup
+
+1. Open `{project_name}.Rproj` in RStudio
+2. Run `renv::init()` to set up reproducible environment
+3. Install required packages: `install.packages(c('here', 'readr', 'fs', 'pointblank'))`
+4. Run `renv::snapshot()` to save package versions
+
+## Directory Structure
+
+- `data/raw/`: Raw data files (auto-populated by ingest pipeline)
+- `data/clean/`: Cleaned data files
+- `catalog/manifest.csv`: Data provenance tracking
+- `R/`: Analysis scripts and helper functions
+""")
     print(f"  ✓ Created README.md")
 
     print(f"\n✅ Project '{project_name}' created successfully!")
@@ -354,75 +1112,113 @@ def init_project(project_name: str, config: Dict) -> None:
 # File Ingestion
 # ============================================================================
 
+def in_tooling_repo(filepath: str, report: bool = True) -> bool:
+    """True if filepath is inside the tooling repo, printing an error if `report`."""
+    abs_filepath = os.path.abspath(filepath)
+    if abs_filepath != TOOLING_DIR and not abs_filepath.startswith(TOOLING_DIR + os.sep):
+        return False
+
+    if report:
+        print(f"Error: Cannot ingest files from within the tooling repo", file=sys.stderr)
+        print(f"  File: {filepath}", file=sys.stderr)
+    return True
+
+
 def ingest_file(filepath: str, project: str, subdir: str, config: Dict,
-                source: str = "manual", notes: str = "") -> bool:
+                source: str = "manual", notes: str = "",
+                prepared: Optional[Tuple[str, int, bool]] = None,
+                known_hashes: Optional[Dict[Tuple[str, str], str]] = None,
+                hash_index: Optional[Set[bytes]] = None,
+                manifest_writers: Optional[Dict[str, Dict]] = None) -> bool:
     """
     Ingest a single file into a project.
 
+    `prepared` is the (non-None) result of hash_file() if the caller already
+    hashed the file (e.g. in a worker thread); otherwise it is computed here.
+    Batch callers also check in_tooling_repo() before hashing.
+    `known_hashes` maps (digest_algo, digest) to paths for batch callers and
+    is kept up to date as files are ingested.
+    `hash_index` is the project's load_hash_index() set. The first digest
+    found in it loads the whole manifest into `known_hashes` once and
+    empties the index, since the map is complete from then on.
+    `manifest_writers` holds open manifests (see record_manifest_row).
+
     Returns True if successful, False if skipped (duplicate).
     """
-    # Validate file exists
-    if not os.path.exists(filepath):
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        return False
+    original_name = Path(filepath).name
 
     # Check if trying to ingest into tooling repo
+    if in_tooling_repo(filepath):
+        return False
+
     abs_filepath = os.path.abspath(filepath)
-    tooling_repo = os.path.abspath(os.path.dirname(__file__))
-    if abs_filepath.startswith(tooling_repo):
-        print(f"Error: Cannot ingest files from within the tooling repo", file=sys.stderr)
-        print(f"  File: {filepath}", file=sys.stderr)
+
+    algorithm = get_hash_algorithm(config)
+    algo_label = algorithm.upper()
+
+    # Stabilize and hash file (also validates that it exists)
+    if prepared is None:
+        prepared = hash_file(filepath, algorithm)
+    if prepared is None:
+        print(f"Error: File not found: {filepath}", file=sys.stderr)
         return False
+    digest, size_bytes, stable = prepared
 
-    # Stabilize file
-    print(f"Stabilizing: {os.path.basename(filepath)}", end='', flush=True)
-    if not stabilize_file(filepath):
+    print(f"Stabilizing: {original_name}", end='', flush=True)
+    if not stable:
         print(" [TIMEOUT]")
         print(f"Warning: File may still be downloading, proceeding anyway", file=sys.stderr)
     else:
         print(" [OK]")
 
-    # Compute hash
-    print(f"Computing SHA256...", end='', flush=True)
-    sha256 = compute_sha256(filepath)
-    print(f" {sha256[:16]}...")
+    print(f"Computing {algo_label}... {digest[:16]}...")
 
-    # Get file info
-    original_name = os.path.basename(filepath)
-    size_bytes = os.path.getsize(filepath)
+    # One timestamp for both the filename and manifest row
+    now = datetime.now()
 
     # Build paths
     projects_base = config['projects_base']
     project_path = os.path.join(projects_base, project)
-    manifest_path = os.path.join(project_path, 'catalog', 'manifest.csv')
+    manifest_path = get_manifest_path(project, config)
 
     # Check for duplicate
-    existing = check_duplicate(manifest_path, sha256)
+    key = (algorithm, digest)
+    if known_hashes is None:
+        existing = check_duplicate(manifest_path, digest, algorithm)
+    else:
+        existing = known_hashes.get(key)
+        if existing is None and hash_index and bytes.fromhex(digest) in hash_index:
+            for known_key, known_path in load_known_hashes(manifest_path).items():
+                known_hashes.setdefault(known_key, known_path)
+            hash_index.clear()
+            existing = known_hashes.get(key)
     if existing:
-        print(f"⚠️  Duplicate detected (SHA256 match)")
+        print(f"⚠️  Duplicate detected ({algo_label} match)")
         print(f"   Existing: {existing}")
         print(f"   Skipping ingest, recording alias in manifest")
+        drop_page_cache(filepath)
 
         # Record as duplicate
         row = {
             'project': project,
             'stage': 'raw',
             'path': abs_filepath,
-            'ts': datetime.now().isoformat(),
+            'ts': now.isoformat(),
             'original_name': original_name,
             'size_bytes': size_bytes,
-            'sha256': sha256,
+            'sha256': digest,
             'source': source,
             'notes': f"Duplicate of {existing}. {notes}".strip(),
             'action': 'duplicate_skipped',
             'derived_from': '',
             'code_commit': '',
+            'digest_algo': algorithm,
         }
-        append_to_manifest(manifest_path, row)
+        record_manifest_row(manifest_path, row, manifest_writers)
         return False
 
     # Generate new filename
-    new_filename = generate_timestamped_filename(original_name, config)
+    new_filename = generate_timestamped_filename(original_name, config, now=now)
 
     # Build destination path
     dest_dir = os.path.join(project_path, subdir)
@@ -430,44 +1226,46 @@ def ingest_file(filepath: str, project: str, subdir: str, config: Dict,
 
     dest_path = os.path.join(dest_dir, new_filename)
 
-    # Handle collisions
+    # Handle collisions (reserves dest_path)
     dest_path = handle_collision(dest_path)
 
     # Move file
     print(f"Moving to: {os.path.relpath(dest_path, projects_base)}")
-    shutil.move(filepath, dest_path)
+    move_file(filepath, dest_path)
 
     # Record in manifest
     row = {
         'project': project,
         'stage': 'raw',
         'path': os.path.abspath(dest_path),
-        'ts': datetime.now().isoformat(),
+        'ts': now.isoformat(),
         'original_name': original_name,
         'size_bytes': size_bytes,
-        'sha256': sha256,
+        'sha256': digest,
         'source': source,
         'notes': notes,
         'action': 'ingested',
         'derived_from': '',
         'code_commit': '',
+        'digest_algo': algorithm,
     }
-    append_to_manifest(manifest_path, row)
+    record_manifest_row(manifest_path, row, manifest_writers)
+    if known_hashes is not None:
+        known_hashes.setdefault(key, row['path'])
 
     print(f"✅ Ingested successfully")
     return True
 
 
-def route_file(filepath: str, config: Dict) -> Optional[Tuple[str, str]]:
+def compile_routing_rules(config: Dict) -> List[Tuple[re.Pattern, str, str]]:
     """
-    Route a file based on regex patterns in config.
+    Compile routing rules from config into (pattern, project, subdir) tuples.
 
-    Returns (project, subdir) tuple or None if no match.
+    Rules missing any field are dropped. Patterns are case-insensitive.
     """
-    routing_rules = config.get('routing', [])
-    basename = os.path.basename(filepath)
+    rules = []
 
-    for rule in routing_rules:
+    for rule in config.get('routing', []):
         pattern = rule.get('pattern')
         project = rule.get('project')
         subdir = rule.get('subdir')
@@ -475,8 +1273,25 @@ def route_file(filepath: str, config: Dict) -> Optional[Tuple[str, str]]:
         if not all([pattern, project, subdir]):
             continue
 
-        # Case-insensitive regex match
-        if re.search(pattern, basename, re.IGNORECASE):
+        try:
+            rules.append((re.compile(pattern, re.IGNORECASE), project, subdir))
+        except re.error as e:
+            print(f"Error: Invalid routing pattern {pattern!r}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    return rules
+
+
+def route_file(filepath: str, rules: List[Tuple[re.Pattern, str, str]]) -> Optional[Tuple[str, str]]:
+    """
+    Route a file using rules from compile_routing_rules(). First match wins.
+
+    Returns (project, subdir) tuple or None if no match.
+    """
+    basename = os.path.basename(filepath)
+
+    for pattern, project, subdir in rules:
+        if pattern.search(basename):
             return (project, subdir)
 
     return None
@@ -500,37 +1315,76 @@ def cmd_add(args, config):
     success_count = 0
     skip_count = 0
 
+    # Expand globs
+    from glob import glob
+    files = []
     for filepath in args.paths:
-        # Expand globs
-        from glob import glob
-        files = glob(os.path.expanduser(filepath))
+        matched = glob(os.path.expanduser(filepath))
 
-        if not files:
+        if not matched:
             print(f"Warning: No files match pattern: {filepath}", file=sys.stderr)
             continue
 
-        for f in files:
+        for f in matched:
             if os.path.isdir(f):
                 print(f"Skipping directory: {f}", file=sys.stderr)
                 continue
+            if in_tooling_repo(f):
+                skip_count += 1
+                continue
+            files.append(f)
+
+    algorithm = get_hash_algorithm(config)
+    check_hash_backend(algorithm)
+    manifest_path = get_manifest_path(args.project, config)
+    known_hashes = {}
+    hash_index = load_hash_index(manifest_path)
+    if hash_index is None:
+        known_hashes = load_known_hashes(manifest_path)
+
+    manifest_writers = {}
+
+    # Stabilize and hash in worker threads; moves and manifest updates stay
+    # on this thread, in order, overlapping with later files' hashing
+    stabilize_pool = ThreadPoolExecutor(max_workers=STABILIZE_WORKERS)
+    hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS)
+    try:
+        futures = [submit_hash_pipeline(f, algorithm, stabilize_pool, hash_pool)
+                   for f in files]
 
+        for f, future in zip(files, futures):
             print(f"\n{'='*60}")
             print(f"File: {f}")
             print(f"{'='*60}")
 
+            prepared = future.result()
+            if prepared is None:
+                print(f"Error: File not found: {f}", file=sys.stderr)
+                skip_count += 1
+                continue
+
             result = ingest_file(
                 f,
                 args.project,
                 args.subdir,
                 config,
                 source=args.source or "manual",
-                notes=args.notes or ""
+                notes=args.notes or "",
+                prepared=prepared,
+                known_hashes=known_hashes,
+                hash_index=hash_index,
+                manifest_writers=manifest_writers
             )
 
             if result:
                 success_count += 1
             else:
                 skip_count += 1
+    finally:
+        # Record already-moved files before waiting on the worker pools
+        close_manifests(manifest_writers)
+        stabilize_pool.shutdown(cancel_futures=True)
+        hash_pool.shutdown(cancel_futures=True)
 
     print(f"\n{'='*60}")
     print(f"Summary: {success_count} ingested, {skip_count} skipped")
@@ -550,9 +1404,8 @@ def cmd_route(args, config):
             sys.exit(1)
 
         # Get all files in downloads (non-recursive)
-        files = [os.path.join(downloads_dir, f)
-                for f in os.listdir(downloads_dir)
-                if os.path.isfile(os.path.join(downloads_dir, f))]
+        with os.scandir(downloads_dir) as entries:
+            files = [entry.path for entry in entries if entry.is_file()]
 
         if not files:
             print("No files found in Downloads directory")
@@ -579,35 +1432,82 @@ def cmd_route(args, config):
     skip_count = 0
     no_route_count = 0
 
-    for filepath in files:
-        print(f"\n{'='*60}")
-        print(f"File: {os.path.basename(filepath)}")
-        print(f"{'='*60}")
+    # Route files up front so only routed files are hashed
+    rules = compile_routing_rules(config)
+    routes = [route_file(filepath, rules) for filepath in files]
+    blocked = [bool(route) and in_tooling_repo(filepath, report=False)
+               for filepath, route in zip(files, routes)]
 
-        # Route file
-        route = route_file(filepath, config)
+    # Duplicate-check state per routed project, loaded on first use
+    algorithm = get_hash_algorithm(config)
+    check_hash_backend(algorithm)
+    known_hashes = {}
+    hash_indexes = {}
 
-        if not route:
-            print(f"⚠️  No routing rule matched, skipping")
-            no_route_count += 1
-            continue
+    manifest_writers = {}
 
-        project, subdir = route
-        print(f"Routed to: {project}/{subdir}")
+    # Stabilize and hash in worker threads; moves and manifest updates stay
+    # on this thread, in order, overlapping with later files' hashing
+    stabilize_pool = ThreadPoolExecutor(max_workers=STABILIZE_WORKERS)
+    hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS)
+    try:
+        futures = [submit_hash_pipeline(filepath, algorithm, stabilize_pool, hash_pool)
+                   if route and not is_blocked else None
+                   for filepath, route, is_blocked in zip(files, routes, blocked)]
 
-        result = ingest_file(
-            filepath,
-            project,
-            subdir,
-            config,
-            source="Downloads" if args.from_downloads else "routed",
-            notes=""
-        )
+        for filepath, route, is_blocked, future in zip(files, routes, blocked, futures):
+            print(f"\n{'='*60}")
+            print(f"File: {os.path.basename(filepath)}")
+            print(f"{'='*60}")
 
-        if result:
-            success_count += 1
-        else:
-            skip_count += 1
+            if not route:
+                print(f"⚠️  No routing rule matched, skipping")
+                no_route_count += 1
+                continue
+
+            project, subdir = route
+            print(f"Routed to: {project}/{subdir}")
+
+            if is_blocked:
+                in_tooling_repo(filepath)
+                skip_count += 1
+                continue
+
+            prepared = future.result()
+            if prepared is None:
+                print(f"Error: File not found: {filepath}", file=sys.stderr)
+                skip_count += 1
+                continue
+
+            if project not in hash_indexes:
+                manifest_path = get_manifest_path(project, config)
+                known_hashes[project] = {}
+                hash_indexes[project] = load_hash_index(manifest_path)
+                if hash_indexes[project] is None:
+                    known_hashes[project] = load_known_hashes(manifest_path)
+
+            result = ingest_file(
+                filepath,
+                project,
+                subdir,
+                config,
+                source="Downloads" if args.from_downloads else "routed",
+                notes="",
+                prepared=prepared,
+                known_hashes=known_hashes[project],
+                hash_index=hash_indexes[project],
+                manifest_writers=manifest_writers
+            )
+
+            if result:
+                success_count += 1
+            else:
+                skip_count += 1
+    finally:
+        # Record already-moved files before waiting on the worker pools
+        close_manifests(manifest_writers)
+        stabilize_pool.shutdown(cancel_futures=True)
+        hash_pool.shutdown(cancel_futures=True)
 
     print(f"\n{'='*60}")
     print(f"Summary: {success_count} ingested, {skip_count} duplicates, {no_route_count} not routed")
@@ -616,50 +1516,86 @@ def cmd_route(args, config):
 
 def cmd_status(args, config):
     """Handle status subcommand."""
-    projects_base = config['projects_base']
-    project_path = os.path.join(projects_base, args.project)
-    manifest_path = os.path.join(project_path, 'catalog', 'manifest.csv')
+    manifest_path = get_manifest_path(args.project, config)
 
     if not os.path.exists(manifest_path):
         print(f"No manifest found for project: {args.project}")
         print(f"Expected: {manifest_path}")
         return
 
-    # Read manifest
-    df = pd.read_csv(manifest_path)
+    limit = args.limit
+
+    # Key columns to show
+    cols = ['ts', 'stage', 'original_name', 'action', 'size_bytes', 'sha256']
 
-    if len(df) == 0:
+    mirror = read_manifest_parquet(manifest_path, cols)
+    if mirror is not None:
+        header = mirror.column_names
+        total = mirror.num_rows
+        tail = mirror.slice(max(total - limit, 0))
+        recent = list(zip(*(tail.column(name).to_pylist() for name in header)))
+    else:
+        # Read manifest, keeping only the last N rows in memory
+        total = 0
+        recent = deque(maxlen=limit)
+        with open(manifest_path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for row in reader:
+                total += 1
+                recent.append(row)
+
+    if total == 0:
         print(f"Manifest is empty for project: {args.project}")
         return
 
-    # Show last N rows
-    limit = args.limit or 20
-    recent = df.tail(limit)
-
     print(f"\n{'='*60}")
     print(f"Project: {args.project}")
     print(f"Manifest: {manifest_path}")
-    print(f"Total entries: {len(df)}")
+    print(f"Total entries: {total}")
     print(f"Showing last {len(recent)} entries:")
     print(f"{'='*60}\n")
 
-    # Format output
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', None)
-    pd.set_option('display.max_colwidth', 50)
+    display_cols = [c for c in cols if c in header]
+    indices = [header.index(c) for c in display_cols]
 
-    # Show key columns
-    cols = ['ts', 'stage', 'original_name', 'action', 'size_bytes', 'sha256']
-    display_cols = [c for c in cols if c in recent.columns]
-
-    print(recent[display_cols].to_string(index=False))
+    print(format_table(display_cols, [[row[i] if i < len(row) else '' for i in indices]
+                                      for row in recent]))
     print(f"\n{'='*60}")
 
 
+def format_table(header: List[str], rows: List[List[str]], max_colwidth: int = 64) -> str:
+    """Format rows as a plain-text table with aligned columns."""
+    def clip(value: str) -> str:
+        if len(value) > max_colwidth:
+            return value[:max_colwidth - 3] + '...'
+        return value
+
+    rows = [[clip(value) for value in row] for row in rows]
+    widths = [max([len(h)] + [len(row[i]) for row in rows]) for i, h in enumerate(header)]
+
+    lines = ['  '.join(h.ljust(w) for h, w in zip(header, widths)).rstrip()]
+    for row in rows:
+        lines.append('  '.join(v.ljust(w) for v, w in zip(row, widths)).rstrip())
+
+    return '\n'.join(lines)
+
+
 # ============================================================================
 # Main CLI
 # ============================================================================
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Research Data Pipeline - Privacy-first data ingestion',
@@ -707,7 +1643,8 @@ def main():
         help='Show recent manifest entries for a project'
     )
     parser_status.add_argument('--project', required=True, help='Project name')
-    parser_status.add_argument('--limit', type=int, help='Number of entries to show (default: 20)')
+    parser_status.add_argument('--limit', type=positive_int, default=20,
+                               help='Number of entries to show (default: 20)')
 
     args = parser.parse_args()
 